@@ -1,5 +1,5 @@
-import key_map
-from key_input import get_key, check_for_key_press
+from . import key_map
+from .key_input import get_key, get_key_raw, get_keys_available, check_for_key_press, poll_key, raw_mode
 import threading
 
 def keyboard_input(stop_thread, handle_input_func):
@@ -13,9 +13,12 @@ def keyboard_input(stop_thread, handle_input_func):
     Returns:
         None
     """
-    while not stop_thread.is_set():
-        key = get_key()
-        handle_input_func(key)  # Pass the key to the input loop function
+    with raw_mode():  # Set up the terminal once for the thread instead of around every read
+        while not stop_thread.is_set():
+            for key in get_keys_available(get_key_raw):
+                if stop_thread.is_set():
+                    break  # Drop the rest of the batch once the handler has stopped the thread
+                handle_input_func(key)  # Pass the key to the input loop function
 
 def start_keyboard_thread(handle_input_func):
     """
@@ -1,28 +1,29 @@
-from MY_INPUT_v2 import start_keyboard_thread, stop_keyboard_thread
+from MY_INPUT_v2 import get_key_raw, poll_key, raw_mode
 import MY_INPUT_v2.key_map as key_map
 
 exit_program = False
+cookie_count = 0
+count_changed = False
 
-def handle_input(_key):
+def handle_input(key, quit_key=key_map.SMALL_Q, cookie_key=key_map.SMALL_C):
+    # The compared keys are bound as default arguments so they are plain local reads per keystroke
     global cookie_count, count_changed, exit_program
 
-    key, state = _key
-
-    if key == key_map.SMALL_Q:
-        stop_keyboard_thread(k_thread)
+    if key is quit_key:
         exit_program = True
-    elif key == key_map.SMALL_C:
+    elif key is cookie_key:
         cookie_count += 1
         count_changed = True
 
 if __name__ == "__main__":
-    k_thread = start_keyboard_thread(handle_input)
-
-    cookie_count = 0
-    count_changed = False
+    print("Cookie count :", cookie_count, end="\r", flush=True)
 
-    print("Cookie count :", cookie_count, end="\r")
-    while not exit_program:
-        if count_changed:
-            print("Cookie count :", round(cookie_count, 2), end="\r")
-            count_changed = False
+    # Input is polled from the main loop itself, so no keyboard thread or cross-thread signalling is needed
+    with raw_mode():
+        while not exit_program:
+            key = poll_key(0.1, get_key_raw)  # Sleeps until a key arrives or the timeout passes
+            if key is not None:
+                handle_input(key)
+            if count_changed:
+                print("Cookie count :", round(cookie_count, 2), end="\r", flush=True)
+                count_changed = False
@@ -1,8 +1,17 @@
+import os
 import sys
-from .key_map import (DIRECT_KEYS, EXTENDED_KEYS, PARENT_000, PARENT_224, UNKNOWN_KEY)
+import time
+from contextlib import contextmanager
+from .key_map import (DIRECT_KEY_ARRAY, EXTENDED_KEY_ARRAYS, PARENT_000, PARENT_224, _BYTE_SINGLETONS)
 
 WINDOWS = bool(sys.platform == "win32")
 
+# Resolved once here so get_key doesn't look into the parent key hashes on every keystroke
+PARENT_000_BYTE = PARENT_000.code[0]
+PARENT_224_BYTE = PARENT_224.code[0]
+PARENT_000_KEYS = EXTENDED_KEY_ARRAYS[PARENT_000.code]
+PARENT_224_KEYS = EXTENDED_KEY_ARRAYS[PARENT_224.code]
+
 if WINDOWS:
     import msvcrt
 else:
@@ -14,7 +23,7 @@ else:
 def get_char():
     if WINDOWS:
         # Direct function available for Windows
-        return msvcrt.getch()
+        return _BYTE_SINGLETONS[msvcrt.getch()]
     else:
         # Obtain the file descriptor associated with the standard input (usually the keyboard).
         file_descriptor = sys.stdin.fileno()
@@ -26,32 +35,91 @@ def get_char():
             # Set the terminal to raw mode, which allows reading individual characters without buffering.
             tty.setraw(file_descriptor)
 
-            # Read a single character from the terminal input.
-            char = sys.stdin.read(1)
+            # Read a single byte straight from the file descriptor (bytes, like msvcrt.getch on Windows).
+            char = os.read(file_descriptor, 1)
         finally:
             # Restore the original terminal settings.
             termios.tcsetattr(file_descriptor, termios.TCSADRAIN, old_setting)
 
-        # Return the captured character.
-        return char
+        # Return the captured byte as its canonical singleton.
+        if not char:
+            raise EOFError("Standard input was closed")
+        return _BYTE_SINGLETONS[char]
+
+
+def get_char_raw():
+    if WINDOWS:
+        return _BYTE_SINGLETONS[msvcrt.getch()]
+    else:
+        # The terminal is expected to be in raw mode already (see raw_mode), so this is a single read.
+        char = os.read(sys.stdin.fileno(), 1)
+        if not char:
+            raise EOFError("Standard input was closed")
+        return _BYTE_SINGLETONS[char]
+
+
+@contextmanager
+def raw_mode():
+    # Keep the terminal in raw mode for the whole block, so reads inside it can use get_char_raw/get_key_raw
+    if WINDOWS:
+        yield
+        return
+
+    file_descriptor = sys.stdin.fileno()
+    old_setting = termios.tcgetattr(file_descriptor)
+    try:
+        tty.setraw(file_descriptor)
+        yield
+    finally:
+        termios.tcsetattr(file_descriptor, termios.TCSADRAIN, old_setting)
 
 
 def check_for_key_press():
     if WINDOWS:
         return msvcrt.kbhit()
     else:
-        return select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], [])
+        file_descriptor = sys.stdin.fileno()
+        return select.select([file_descriptor], [], [], 0)[0] == [file_descriptor]
 
 
-def get_key():
-    char = get_char()
+def get_key(char_reader=get_char):
+    # Keys are resolved by indexing 256-entry tables with the byte value, so no hashing or dict lookup is needed.
+    # Extended keys index their parent's table with the extended byte.
+    code = ord(char_reader())
 
-    if char == PARENT_224["code"]:
-        extended_char = get_char()
-        key = EXTENDED_KEYS[char].get(extended_char, UNKNOWN_KEY)
-    elif char == PARENT_000["code"]:
-        extended_char = get_char()
-        key = EXTENDED_KEYS[char].get(extended_char, UNKNOWN_KEY)
+    if code == PARENT_224_BYTE:
+        return PARENT_224_KEYS[ord(char_reader())]
+    elif code == PARENT_000_BYTE:
+        return PARENT_000_KEYS[ord(char_reader())]
+
+    return DIRECT_KEY_ARRAY[code]
+
+
+def get_key_raw():
+    # Same as get_key, but must be called inside raw_mode()
+    return get_key(get_char_raw)
+
+
+def get_keys_available(key_reader=get_key):
+    # Block for the first key, then drain every key already buffered so a burst is handled in one batch
+    keys = [key_reader()]
+    while check_for_key_press():
+        keys.append(key_reader())
+    return keys
+
+
+def poll_key(timeout=None, key_reader=get_key):
+    # Wait up to timeout seconds (forever if None) for a key press and read it; None if no key arrived in time.
+    # Lets a single-threaded loop handle input without a keyboard thread.
+    if WINDOWS:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not msvcrt.kbhit():
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(0.001)
     else:
-        key = DIRECT_KEYS.get(char, UNKNOWN_KEY)
+        file_descriptor = sys.stdin.fileno()
+        if not select.select([file_descriptor], [], [], timeout)[0]:
+            return None
 
+    return key_reader()
@@ -1,3 +1,4 @@
+import os
 import sys
 from getpass import getpass
 
@@ -7,6 +8,9 @@ else:
     import tty     # Import modules related to Mac and Linux
     import termios
 
+# msvcrt.getch returns one byte per character; POSIX terminals send UTF-8
+PASSWORD_ENCODING = "latin-1" if sys.platform == "win32" else "utf-8"
+
 
 def get_char():
     if sys.platform == "win32":
@@ -23,16 +27,24 @@ def get_char():
             # Set the terminal to raw mode, which allows reading individual characters without buffering.
             tty.setraw(file_descriptor)
 
-            # Read a single character from the terminal input.
-            char = sys.stdin.read(1)
+            # Read a single byte straight from the file descriptor, skipping the text decoding layer.
+            char = os.read(file_descriptor, 1)
         finally:
             # Restore the original terminal settings.
             termios.tcsetattr(file_descriptor, termios.TCSADRAIN, old_setting)
 
-        # Return the captured character.
+        # Return the captured byte.
         return char
 
 
+def get_char_raw():
+    if sys.platform == "win32":
+        return msvcrt.getch()
+    else:
+        # The terminal is already in raw mode (see get_password), so just read the byte.
+        return os.read(sys.stdin.fileno(), 1)
+
+
 def get_password(prompt="Password: ", mask_char="*") -> str:
     ########################################################################
     # Check if given prompt and mask character are valid
@@ -53,36 +65,63 @@ def get_password(prompt="Password: ", mask_char="*") -> str:
     ########################################################################
     # Actual logic for input starts here
 
-    password_chars = []
-
     sys.stdout.write(prompt)  # Similar to print(prompt)
     sys.stdout.flush()  # Flushes the stdout so that the prompt is printed immediately and not stored to print later
 
+    if sys.platform == "win32":
+        password = read_masked_password(mask_char)
+    else:
+        # Switch the terminal to raw mode once for the whole password instead of around every character.
+        file_descriptor = sys.stdin.fileno()
+        old_setting = termios.tcgetattr(file_descriptor)
+        try:
+            tty.setraw(file_descriptor)
+            password = read_masked_password(mask_char)
+        finally:
+            termios.tcsetattr(file_descriptor, termios.TCSADRAIN, old_setting)
+
+    sys.stdout.write("\n")  # Written after the terminal is restored, so the newline also returns the cursor
+    return password
+
+
+def read_masked_password(mask_char: str) -> str:
+    password_bytes = bytearray()
+
     while True:
-        key_pressed = ord(get_char())
+        key_pressed = ord(get_char_raw())
 
         if key_pressed == 13:  # i.e. Enter key is pressed
-            sys.stdout.write("\n")
-            return "".join(password_chars)
+            return password_bytes.decode(PASSWORD_ENCODING, "replace")
         elif key_pressed in (8, 127):  # i.e. Backspace or Delete key is pressed
             # Erase previous character
-            if len(password_chars) > 0:
+            if password_bytes:
                 sys.stdout.write("\b \b")  # \b doesn't erase the character, it just moves the cursor back.
                 sys.stdout.flush()
-                password_chars = password_chars[:-1]
+                erase_last_char(password_bytes)
         elif 0 <= key_pressed <= 31:
             # Do nothing for Non-Printable keys (e.g. esc, alt, etc.)
             pass
-        elif key_pressed == 224:  # Means special key triggered (i.e. arrow keys, home, etc.)
-            special_key = ord(get_char())
+        elif key_pressed == 224 and sys.platform == "win32":  # Means special key triggered (i.e. arrow keys, home, etc.)
+            special_key = ord(get_char_raw())
             if special_key == 83:  # Delete Key Pressed
                 # Erase previous character
-                if len(password_chars) > 0:
+                if password_bytes:
                     sys.stdout.write("\b \b")  # \b doesn't erase the character, it just moves the cursor back.
                     sys.stdout.flush()
-                    password_chars = password_chars[:-1]
+                    erase_last_char(password_bytes)
         else:
-            char = chr(key_pressed)
-            sys.stdout.write(mask_char)
-            sys.stdout.flush()
-            password_chars.append(char)
+            if not is_continuation_byte(key_pressed):  # Mask each character once, not each of its bytes
+                sys.stdout.write(mask_char)
+                sys.stdout.flush()
+            password_bytes.append(key_pressed)
+
+
+def is_continuation_byte(byte: int) -> bool:
+    # Only UTF-8 input (POSIX) has multi-byte characters; on Windows every byte is a character.
+    return sys.platform != "win32" and byte & 0xC0 == 0x80
+
+
+def erase_last_char(password_bytes: bytearray) -> None:
+    # Pop the trailing continuation bytes of a multi-byte character along with its lead byte.
+    while password_bytes and is_continuation_byte(password_bytes.pop()):
+        pass
@@ -1,3 +1,11 @@
+import locale
+import os
+import queue
+import re
+import sys
+import threading
+import time
+import weakref
 from datetime import datetime
 from typing import Optional
 from abc import ABC, abstractmethod 
@@ -18,6 +26,52 @@ class LogSettings:
         self.timestamp_format = timestamp_format
         self.info_msg_sep = info_msg_sep
         self.inter_info_sep = inter_info_sep
+        self._log_templates = {}
+        # time.strftime can't express these directives the way datetime.strftime does, so they skip the cache
+        self._cache_timestamps = not any(directive in timestamp_format for directive in ("%f", "%z", "%Z"))
+        self._timestamp_cache = (None, "")  # (second, formatted timestamp) of the last timestamp made
+
+    def get_current_timestamp(self) -> str:
+        """
+        Get the current time formatted with timestamp_format.
+        The formatted string is reused for every call within the same second.
+
+        :return: The formatted timestamp.
+        """
+        if not self._cache_timestamps:
+            return datetime.now().strftime(self.timestamp_format)
+
+        now = int(time.time())
+        cached_second, timestamp = self._timestamp_cache
+        if now != cached_second:
+            timestamp = time.strftime(self.timestamp_format, time.localtime(now))
+            self._timestamp_cache = (now, timestamp)
+        return timestamp
+
+    def get_log_template(self, log_type: 'LogType') -> str:
+        """
+        Get the line prefix for a log type as a %-style template whose only placeholder is the timestamp.
+        Templates are built once per log type and reused.
+
+        :param log_type: The log type.
+        :return: The template, e.g. "[+] | %s | [DEBUG__] :   ".
+        """
+        template = self._log_templates.get(log_type)
+        if template is None:
+            # Literal '%' in the strings is escaped so only the timestamp placeholder is formatted
+            template = self.inter_info_sep.replace("%", "%%").join(
+                [
+                    log_type.bullet_str.replace("%", "%%"),
+                    "%s",
+                    log_type.display_str.replace("%", "%%")
+                ]
+            )
+            template += self.info_msg_sep.replace("%", "%%")
+            self._log_templates[log_type] = template
+        return template
+
+
+LAST_LOG_READ_SIZE = 4096  # Bytes read from the end of a log file when looking for its last log
 
 
 DEFAULT_LOG_SETTINGS = LogSettings(
@@ -26,6 +80,13 @@ DEFAULT_LOG_SETTINGS = LogSettings(
     inter_info_sep=" | "
 )
 
+# Matches a log line written with DEFAULT_LOG_SETTINGS, so it can be parsed without split() and strptime()
+# Groups: bullet, day, month, year, hour, minute, second, display string, message
+DEFAULT_LOG_LINE_RE = re.compile(
+    r"(.*?) \| \[(\d\d)/(\d\d)/(\d{4}), (\d\d):(\d\d):(\d\d)\] \| (.*?) :   (.*)",
+    re.DOTALL
+)
+
 
 class LogType:
     """
@@ -38,12 +99,20 @@ class LogType:
         :param display_str: Display string for the log type.
         :param bullet_str: Bullet string for the log type.
         """
-        self.display_str = display_str
-        self.bullet_str = bullet_str
+        # Interned so equal log types (e.g. ones parsed back from a log file) share the same string objects
+        self.display_str = sys.intern(display_str)
+        self.bullet_str = sys.intern(bullet_str)
 
     def __eq__(self, other):
+        if self is other:
+            return True  # Log types are normally the LOG_TYPES singletons, so this is the common case
+        if not isinstance(other, LogType):
+            return NotImplemented
         return (self.display_str == other.display_str) and (self.bullet_str == other.bullet_str)
 
+    def __hash__(self):
+        return hash((self.display_str, self.bullet_str))
+
 
 class LOG_TYPES:
     DEBUG   = LogType("[DEBUG__]", "[+]")
@@ -80,6 +149,20 @@ def parse_log_str(log_str: str, log_settings: LogSettings) -> LogEntry:
     :return: A LogEntry object.
     :raises ValueError: If the log cannot be parsed.
     """
+    if (log_settings is DEFAULT_LOG_SETTINGS or
+            (log_settings.timestamp_format, log_settings.info_msg_sep, log_settings.inter_info_sep) ==
+            (DEFAULT_LOG_SETTINGS.timestamp_format, DEFAULT_LOG_SETTINGS.info_msg_sep,
+             DEFAULT_LOG_SETTINGS.inter_info_sep)):
+        match = DEFAULT_LOG_LINE_RE.match(log_str)
+        if match:
+            try:
+                time_stamp = datetime(int(match[4]), int(match[3]), int(match[2]),
+                                      int(match[5]), int(match[6]), int(match[7]))
+            except ValueError as e:
+                raise ValueError(f"Invalid Log cannot be parsed. {e}")
+            return LogEntry(match[9], LogType(match[8], match[1]), time_stamp)
+
+    # Custom settings (or a line the fast path didn't match) are parsed from the settings themselves
     try:
         log_info, _, log_msg = log_str.partition(log_settings.info_msg_sep)
         log_info_data = log_info.split(log_settings.inter_info_sep)
@@ -98,15 +181,8 @@ def create_log_message(log_entry: LogEntry, log_settings: LogSettings) -> str:
     :param log_settings: The log settings for formatting.
     :return: The formatted log message.
     """
-    log = log_settings.inter_info_sep.join(
-        [
-            log_entry.log_type.bullet_str,
-            log_entry.timestamp.strftime(log_settings.timestamp_format),
-            log_entry.log_type.display_str
-        ]
-    )
-    log += log_settings.info_msg_sep + log_entry.log_message
-    return log
+    log_template = log_settings.get_log_template(log_entry.log_type)
+    return log_template % log_entry.timestamp.strftime(log_settings.timestamp_format) + log_entry.log_message
 
 
 class LoggerBase(ABC):
@@ -118,6 +194,47 @@ class LoggerBase(ABC):
         pass
 
 
+LOG_WRITE_BATCH_SIZE = 64  # Most queued logs the writer thread joins into a single write
+
+
+def _write_queued_logs(log_file, log_queue: queue.Queue):
+    """
+    Writer thread loop: write queued log lines to the file in batches until a None is queued.
+
+    :param log_file: The open log file; it is closed when the loop ends.
+    :param log_queue: The queue of log lines.
+    """
+    with log_file:
+        while True:
+            batch = [log_queue.get()]
+            while len(batch) < LOG_WRITE_BATCH_SIZE and batch[-1] is not None:
+                try:
+                    batch.append(log_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                log_file.write("".join(line for line in batch if line is not None))
+                log_file.flush()
+            except Exception as e:
+                # Reported instead of raised, so the thread keeps running and flush() doesn't wait forever
+                print(f"Logs could not be written to '{log_file.name}': {e!r}", file=sys.stderr)
+            finally:
+                for _ in batch:
+                    log_queue.task_done()
+
+            if batch[-1] is None:
+                return
+
+
+def _stop_log_writer(log_queue: queue.Queue, writer: threading.Thread):
+    """
+    Queue the stop marker and wait for the writer thread to write everything before it.
+    """
+    log_queue.put(None)
+    writer.join()
+
+
 class FileLogger(LoggerBase):
     """
     Logger for logging to a file.
@@ -131,6 +248,11 @@ class FileLogger(LoggerBase):
         """
         self.file_path = file_path
         self.log_settings = log_settings
+        self._log_queue: Optional[queue.Queue] = None  # Lines waiting for the writer thread
+        self._stop_writer: Optional[weakref.finalize] = None  # Drains the queue and stops the writer thread
+        self._log_encoding: Optional[str] = None  # Encoding of the open log file, set with the writer thread
+        self._last_log_type: Optional[LogType] = None
+        self._last_log_type_loaded = False  # The file is only read once, to find the type of its last log
 
     def log(self, message: str, log_type: LogType = LOG_TYPES.DEBUG):
         """
@@ -139,18 +261,58 @@ class FileLogger(LoggerBase):
         :param message: The log message.
         :param log_type: The log type (default is DEBUG).
         """
-        log_entry = LogEntry(message, log_type)
-        last_log = self.get_last_log()
+        if not self._last_log_type_loaded:
+            last_log = self.get_last_log()
+            self._last_log_type = last_log.log_type if last_log else None
+            self._last_log_type_loaded = True
+        last_log_type = self._last_log_type
 
-        if last_log and (last_log.log_type.display_str, last_log.log_type.bullet_str) != (log_type.display_str, log_type.bullet_str):
+        if last_log_type is not None and last_log_type != log_type:
             line_prefix = "\n"
         else:
             line_prefix = ""
 
-        log_str = line_prefix + create_log_message(log_entry, self.log_settings) + "\n"
+        # Same output as create_log_message, built inline to skip the LogEntry and the extra call per log
+        log_settings = self.log_settings
+        log_str = (line_prefix + log_settings.get_log_template(log_type) % log_settings.get_current_timestamp() +
+                   message + "\n")
+
+        if self._log_queue is None:
+            self._start_writer()
+        # Encoding errors are raised here, in the caller, instead of stopping the writer thread's batch
+        log_str.encode(self._log_encoding)
+        self._log_queue.put(log_str)  # The writer thread does the actual (batched) write
+        self._last_log_type = log_type
 
-        with open(self.file_path, "a") as log_file:
-            log_file.write(log_str)
+    def _start_writer(self):
+        """
+        Open the log file and start the background thread that writes queued logs to it.
+        """
+        log_file = open(self.file_path, "a")  # Opened here so errors surface in the caller, not the thread
+        log_queue = queue.Queue()
+        writer = threading.Thread(target=_write_queued_logs, args=(log_file, log_queue), daemon=True)
+        writer.start()
+
+        self._log_queue = log_queue
+        self._log_encoding = log_file.encoding
+        # Also runs when the logger is garbage collected or the interpreter exits, so queued logs aren't lost
+        self._stop_writer = weakref.finalize(self, _stop_log_writer, log_queue, writer)
+
+    def flush(self):
+        """
+        Wait until every queued log has been written to the log file.
+        """
+        if self._log_queue is not None:
+            self._log_queue.join()
+
+    def close(self):
+        """
+        Write any queued logs, stop the writer thread and close the log file. Logging again reopens it.
+        """
+        if self._stop_writer is not None:
+            self._stop_writer()
+            self._stop_writer = None
+            self._log_queue = None
 
     def get_last_log(self) -> Optional[LogEntry]:
         """
@@ -158,28 +320,40 @@ class FileLogger(LoggerBase):
 
         :return: The last log entry or None if there are no logs.
         """
+        self.flush()
         try:
-            with open(self.file_path, 'r') as log_file:
-                log_lines = log_file.readlines()
-                if not log_lines:
-                    return None
-
-                last_line = log_lines[-1]
-                if not last_line:
-                    last_line = log_lines[-2]
-
-                last_log = parse_log_str(last_line, self.log_settings)
-                return last_log
+            with open(self.file_path, 'rb') as log_file:
+                # Only read the tail of the file, growing it until it holds the whole last line
+                file_size = log_file.seek(0, os.SEEK_END)
+                read_size = LAST_LOG_READ_SIZE
+                while True:
+                    start = max(0, file_size - read_size)
+                    log_file.seek(start)
+                    tail = log_file.read()
+                    if start == 0 or b"\n" in tail.rstrip(b"\r\n"):
+                        break
+                    read_size *= 2
 
         except IOError:
             return None
 
+        # The tail may start in the middle of a character; that partial first line is never the one parsed
+        tail_str = tail.decode(locale.getpreferredencoding(False), errors="replace")
+        log_lines = [line for line in tail_str.splitlines(keepends=True) if line.strip()]
+        if not log_lines:
+            return None
+
+        return parse_log_str(log_lines[-1], self.log_settings)
+
     def clear_logs_from_file(self):
         """
         Clear all logs from the log file.
         """
+        self.close()
         with open(self.file_path, "w") as log_file:
             log_file.write("")
+        self._last_log_type = None
+        self._last_log_type_loaded = True
 
 
 class ConsoleLogger(LoggerBase):
@@ -201,9 +375,8 @@ class ConsoleLogger(LoggerBase):
         :param message: The log message.
         :param log_type: The log type (default is DEBUG).
         """
-        log_entry = LogEntry(message, log_type)
-        log_msg = create_log_message(log_entry, self.log_settings)
-        print(log_msg)
+        log_settings = self.log_settings
+        print(log_settings.get_log_template(log_type) % log_settings.get_current_timestamp() + message)
 
 
 class Logger:
@@ -263,3 +436,5 @@ if __name__ == '__main__':
                 f_logger.log(f"{i} gives reminder {100 % i} when dividing 100", LOG_TYPES.DEBUG)
     except Exception as e:
         f_logger.log(str(e), LOG_TYPES.ERROR)
+    finally:
+        f_logger.close()
@@ -1,12 +1,23 @@
 """
 This module implements a table mapping.
 """
+import copy
 import json
-from typing import Any, Literal, Optional, Callable
+import re
+from typing import Any, Literal, Optional, Callable, Iterable, Iterator, KeysView
 from pprint import pformat
 import datetime
 import decimal
 import collections
+from itertools import compress, starmap
+
+try:
+    import orjson  # Optional, a faster drop-in for the json module when it is installed
+except ImportError:
+    orjson = None
+
+# orjson reads ints past 64 bits as floats, so files holding runs of this many digits are parsed with json instead
+_LONG_DIGIT_RUN = re.compile(rb'\d{19,}')
 
 
 class NonSupportedType(TypeError):
@@ -29,8 +40,104 @@ class NullValueError(ValueError):
     """Exception for null values."""
 
 
+class _IntUniqueData:
+    """Set-like store for the unique values of an int column.
+
+    Small non-negative ints, the usual case for keys, are kept as one flag byte each in a bytearray instead of a
+    hash set slot. The bytearray only grows while it stays dense (at most about 4 bytes per stored value), so a few
+    large keys cannot blow it up. Any other value falls back to a regular set.
+    """
+    __slots__ = ('_flags', '_flag_count', '_others')
+    _FLAG_LIMIT = 1 << 24  # Largest flag array is 16 MB
+
+    def __init__(self) -> None:
+        """Initialize an empty _IntUniqueData instance."""
+        self._flags = bytearray()
+        self._flag_count = 0
+        self._others = set()
+
+    def __contains__(self, value: Any) -> bool:
+        if isinstance(value, int) and 0 <= value < len(self._flags):
+            return self._flags[value] == 1
+        return value in self._others
+
+    def __len__(self) -> int:
+        return self._flag_count + len(self._others)
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from compress(range(len(self._flags)), self._flags)
+        yield from self._others
+
+    def __repr__(self) -> str:
+        return f"{{{', '.join(map(repr, self))}}}" if len(self) else "set()"
+
+    def add(self, value: Any) -> None:
+        """Add a value.
+
+        Args:
+            value (Any): The value to be added.
+        """
+        flags = self._flags
+        if isinstance(value, int) and value >= 0:
+            if value >= len(flags):
+                dense_limit = min(max(1024, 4 * (len(self) + 1)), self._FLAG_LIMIT)
+                if value >= dense_limit:
+                    self._others.add(value)
+                    return
+                # Grow geometrically so that adding ascending keys is amortized O(1)
+                self._grow_flags(min(max(value + 1, 2 * len(flags)), dense_limit))
+            if not flags[value]:
+                flags[value] = 1
+                self._flag_count += 1
+        else:
+            self._others.add(value)
+
+    def _grow_flags(self, new_length: int) -> None:
+        """Extend the flag array, moving the values it now covers out of the fallback set.
+
+        Args:
+            new_length (int): The new length of the flag array.
+        """
+        flags = self._flags
+        old_length = len(flags)
+        flags.extend(bytes(new_length - old_length))
+
+        # Every int in range(len(flags)) must live in the flags, __contains__ and remove only look there
+        covered_values = [value for value in self._others
+                          if isinstance(value, int) and old_length <= value < new_length]
+        for value in covered_values:
+            self._others.remove(value)
+            flags[value] = 1
+        self._flag_count += len(covered_values)
+
+    def update(self, values: Iterable[Any]) -> None:
+        """Add many values.
+
+        Args:
+            values (Iterable[Any]): The values to be added.
+        """
+        for value in values:
+            self.add(value)
+
+    def remove(self, value: Any) -> None:
+        """Remove a value, raising KeyError if it is not present.
+
+        Args:
+            value (Any): The value to be removed.
+        """
+        if isinstance(value, int) and 0 <= value < len(self._flags):
+            if not self._flags[value]:
+                raise KeyError(value)
+            self._flags[value] = 0
+            self._flag_count -= 1
+        else:
+            self._others.remove(value)
+
+
 class TableColumn:
     """Represents a column in a table."""
+    __slots__ = ('name', 'data_type', 'is_nullable', 'is_primary_key', 'is_unique', 'is_indexed', 'has_default',
+                 '_default_data', '_needs_unique_check', '_unique_data', '_unique_contains')
     _repr_to_type = {
         '<int>': int, '<float>': float,  # Numeric types
         '<str>': str,  # String types
@@ -80,6 +187,11 @@ class TableColumn:
         self.is_indexed = is_indexed
         self.has_default = has_default
 
+        # Cached so is_data_valid can test uniqueness without re-reading the flags and the set per row
+        self._needs_unique_check = is_unique
+        if self.is_unique:
+            self._reset_unique_data()
+
         if has_default:
             is_default_valid, error = self.is_data_valid(default_data)
             if is_default_valid:
@@ -87,9 +199,6 @@ class TableColumn:
             else:
                 raise error
 
-        if self.is_unique:
-            self._unique_data = set()
-
     def is_data_valid(self, data: Any) -> tuple[bool, Optional[Exception]]:
         """Check if the given data is valid for the column.
 
@@ -99,21 +208,53 @@ class TableColumn:
         Returns:
             Tuple[bool, Optional[Exception]]: Whether the data is valid or not and an error if not.
         """
-        if data is not None and not isinstance(data, self.data_type):
+        if data is None:
+            # None is never checked for uniqueness, a nullable unique column may hold any number of them
+            if not self.is_nullable:
+                return False, NullValueError(f"Data cannot be null. Column '{self.name}' doesn't allow None values.")
+        elif type(data) is not self.data_type and not isinstance(data, self.data_type):
+            # The identity check settles exact types; only subclasses (e.g. bool in an int column) reach isinstance
             return False, InvalidTypeError(
                 f"Invalid Data Type. Column '{self.name}' only accepts '{self.data_type}' type data. '{type(data)}' is not accepted")
+        elif self._needs_unique_check and self._unique_contains(data):
+            return False, DuplicateValueError(
+                f"Data: '{data}' is not Unique. Given data already exists in the Column: '{self.name}'.")
 
-        if data is None and not self.is_nullable:
-            return False, NullValueError(f"Data cannot be null. Column '{self.name}' doesn't allow None values.")
+        return True, None
 
-        if self.is_unique and not self.is_nullable:
-            if data in self._unique_data:
-                return False, DuplicateValueError(
-                    f"Data: '{data}' is not Unique. Given data already exists in the Column: '{self.name}'.")
-        elif self.is_unique and self.is_nullable:
-            if data is not None and data in self._unique_data:
-                return False, DuplicateValueError(
-                    f"Data: '{data}' is not Unique. Given data already exists in the Column: '{self.name}'.")
+    def are_values_valid(self, values: list[Any]) -> tuple[bool, Optional[Exception]]:
+        """Check if all the given values are valid for the column, as if they were added one after another.
+
+        Args:
+            values (list[Any]): The values to be validated.
+
+        Returns:
+            Tuple[bool, Optional[Exception]]: Whether all the values are valid or not and an error for the first
+            invalid value if not.
+        """
+        # Fast path: whole-column checks on the set of value types and the set of values
+        value_types = set(map(type, values))
+        has_null = type(None) in value_types
+        value_types.discard(type(None))
+        is_valid = value_types <= {self.data_type} and (self.is_nullable or not has_null)
+        if is_valid and self._needs_unique_check:
+            non_null_values = [value for value in values if value is not None] if has_null else values
+            unique_values = set(non_null_values)
+            is_valid = len(unique_values) == len(non_null_values) and not any(map(self._unique_contains, unique_values))
+        if is_valid:
+            return True, None
+
+        # Slow path, taken for invalid data or subclasses of data_type: check value by value to find the exact error
+        seen_values = set()
+        for value in values:
+            is_valid, error = self.is_data_valid(value)
+            if not is_valid:
+                return False, error
+            if self._needs_unique_check and value is not None:
+                if value in seen_values:
+                    return False, DuplicateValueError(
+                        f"Data: '{value}' is not Unique. Given data already exists in the Column: '{self.name}'.")
+                seen_values.add(value)
 
         return True, None
 
@@ -126,6 +267,15 @@ class TableColumn:
         if self.is_unique:
             self._unique_data.add(data)
 
+    def add_values_to_column(self, values: list[Any]) -> None:
+        """Add many values to the column at once, updating unique data if applicable.
+
+        Args:
+            values (list[Any]): The values to be added.
+        """
+        if self.is_unique:
+            self._unique_data.update(values)
+
     def remove_from_column(self, data: Any) -> None:
         """Remove data from the column, updating unique data if applicable.
 
@@ -204,13 +354,22 @@ class TableColumn:
         Returns:
             TableColumn: The cloned TableColumn instance.
         """
-        default_data = self.default_data if self.has_default else None
-        return TableColumn(self.name, self.data_type, self.has_default, default_data, self.is_nullable,
-                           self.is_primary_key, self.is_unique, self.is_indexed)
+        # A shallow copy skips re-validating the default; only the unique data must not be shared with the original
+        column = copy.copy(self)
+        if column.is_unique:
+            column._reset_unique_data()
+        return column
+
+    def _reset_unique_data(self) -> None:
+        """Give the column a new, empty store for its unique values."""
+        self._unique_data = _IntUniqueData() if self.data_type is int else set()
+        self._unique_contains = self._unique_data.__contains__
 
 
 class Table:
     """Represents a table."""
+    __slots__ = ('columns', 'degree', 'primary_column', 'primary_hash', 'index_hash', '_pk_name', '_col_plan',
+                 '_index_plan')
 
     def __init__(self, columns: list[TableColumn]) -> None:
         """Initialize a Table instance.
@@ -230,11 +389,40 @@ class Table:
         else:
             raise ValueError(
                 "No primary column found in table. Atleast one of the columns should have is_primary_key=True.")
+        self._pk_name = self.primary_column.name  # Read on every insert and update
 
+        # Its insertion order is the row order of the table (see row_order)
         self.primary_hash: dict[Any, dict[str, Any]] = {}
         self.index_hash: dict[str, dict[Any, set]] = {column.name: {} for column in self.columns if
                                                       column.is_indexed and not column.is_primary_key}
-        self.row_order: list[Any] = []
+
+        # Per-column callables resolved once, so add_row does no attribute lookups per row
+        self._col_plan = [(column.name, column, column.is_data_valid, column.add_to_column) for column in columns]
+        # The index dicts are only ever updated in place, so they can be cached next to their column names
+        self._index_plan = list(self.index_hash.items())
+
+    @property
+    def row_order(self) -> KeysView:
+        """Get the primary keys of the table in row order.
+
+        Rows are appended as they are added and reordered by sort_rows or by assigning to row_order.
+
+        Returns:
+            KeysView: A live view of the primary keys in row order.
+        """
+        return self.primary_hash.keys()
+
+    @row_order.setter
+    def row_order(self, row_order: Iterable[Any]) -> None:
+        """Reorder the rows of the table.
+
+        Args:
+            row_order (Iterable[Any]): Every primary key of the table, each exactly once, in the new order.
+        """
+        row_order = list(row_order)
+        if len(row_order) != len(self.primary_hash) or set(row_order) != self.primary_hash.keys():
+            raise ValueError("row_order must list every primary key of the table exactly once.")
+        self.primary_hash = {primary_key: self.primary_hash[primary_key] for primary_key in row_order}
 
     def add_row(self, take_default: bool = False, **row_dict: dict[str, Any]) -> None:
         """Add a row to the table.
@@ -243,21 +431,76 @@ class Table:
             take_default (bool): Whether to use default values for missing data.
             **row_dict (Any): Key-value pairs representing the row data.
         """
+        # Validate every column first, so a rejected row never touches any column's unique data
+        values = []
+        for column_name, column, is_data_valid, _ in self._col_plan:
+            if column_name in row_dict:
+                value = row_dict[column_name]
+            elif take_default and column.has_default:
+                value = row_dict[column_name] = column.default_data
+            else:
+                raise MissingDataError(f"Missing value for column: {column_name}")
+
+            is_valid, error = is_data_valid(value)
+            if not is_valid:
+                raise error
+            values.append(value)
+
+        for (_, _, _, add_to_column), value in zip(self._col_plan, values):
+            add_to_column(value)
+
+        primary_key = row_dict[self._pk_name]
+        for column_name, column_index in self._index_plan:
+            value = row_dict[column_name]
+            primary_keys = column_index.get(value)
+            if primary_keys is None:
+                column_index[value] = {primary_key}
+            else:
+                primary_keys.add(primary_key)
+        self.primary_hash[primary_key] = row_dict
+
+    def add_rows(self, column_data: dict[str, list[Any]], take_default: bool = False) -> None:
+        """Add many rows to the table from column-wise data.
+
+        Each column is validated as a whole before anything is added, so either every row is added or none is.
+
+        Args:
+            column_data (dict[str, list[Any]]): Column names mapped to their values, one value per row.
+            take_default (bool): Whether to use default values for columns missing from column_data.
+        """
+        row_counts = {len(values) for values in column_data.values()}
+        if len(row_counts) > 1:
+            raise ValueError("Every column in column_data must have the same number of values.")
+        row_count = row_counts.pop() if row_counts else 0
+
+        row_columns = dict(column_data)
         for column in self.columns:
-            if column.name not in row_dict and take_default:
-                row_dict[column.name] = column.default_data
-            elif column.name not in row_dict and not take_default:
-                raise MissingDataError(f"Missing value for column: {column.name}")
+            if column.name not in row_columns:
+                if take_default and column.has_default:
+                    row_columns[column.name] = [column.default_data] * row_count
+                else:
+                    raise MissingDataError(f"Missing value for column: {column.name}")
 
-            is_data_valid, error = column.is_data_valid(row_dict[column.name])
-            if not is_data_valid:
+            is_valid, error = column.are_values_valid(row_columns[column.name])
+            if not is_valid:
                 raise error
 
         for column in self.columns:
-            column.add_to_column(row_dict[column.name])
+            column.add_values_to_column(row_columns[column.name])
+
+        primary_keys = row_columns[self._pk_name]
+        for column_name, column_index in self._index_plan:
+            for primary_key, value in zip(primary_keys, row_columns[column_name]):
+                value_keys = column_index.get(value)
+                if value_keys is None:
+                    column_index[value] = {primary_key}
+                else:
+                    value_keys.add(primary_key)
 
-        self.row_order.append(row_dict[self.primary_column.name])
-        self.update_row_hash(row_dict)
+        column_names = list(row_columns)
+        primary_hash = self.primary_hash
+        for primary_key, row_values in zip(primary_keys, zip(*row_columns.values())):
+            primary_hash[primary_key] = dict(zip(column_names, row_values))
 
     def delete_row(self, primary_key: Any) -> None:
         """Delete a row from the table.
@@ -274,7 +517,6 @@ class Table:
                     self.index_hash[column.name][value].remove(primary_key)
                     if len(self.index_hash[column.name][value]) < 1:
                         del self.index_hash[column.name][value]
-            self.row_order.remove(primary_key)
         else:
             raise MissingDataError(f"No row with primary key '{primary_key}' found.")
 
@@ -285,35 +527,38 @@ class Table:
             primary_key (Any): The primary key of the row to be updated.
             **row_dict (Any): Key-value pairs representing the updated row data.
         """
-        row_dict[self.primary_column.name] = primary_key
+        row_dict[self._pk_name] = primary_key
 
         if not (primary_key in self.primary_hash):
             raise MissingDataError(f"No row with primary key '{primary_key}' found.")
 
         old_row = self.primary_hash[primary_key]
-        new_row = {}
-        for column in self.columns:
-            if column.name not in row_dict:
-                new_row[column.name] = old_row[column.name]
+        new_row = {column.name: row_dict[column.name] if column.name in row_dict else old_row[column.name]
+                   for column in self.columns}
+
+        # Only indexed columns whose value actually changed need their unique data and index touched
+        changed_columns = [column for column in self.columns
+                           if column.is_indexed and new_row[column.name] != old_row[column.name]]
+        for column in changed_columns:
+            column_name = column.name
+            old_value = old_row[column_name]
+            new_value = new_row[column_name]
+
+            column.remove_from_column(old_value)
+            column.add_to_column(new_value)
+
+            column_index = self.index_hash[column_name]
+            new_value_keys = column_index.get(new_value)
+            if new_value_keys is None:
+                column_index[new_value] = {primary_key}
             else:
-                new_row[column.name] = row_dict[column.name]
+                new_value_keys.add(primary_key)
 
-        for column in self.columns:
-            old_value = old_row[column.name]
-            new_value = new_row[column.name]
-
-            if column.is_indexed and old_value != new_value:
-                column.remove_from_column(old_value)
-                column.add_to_column(new_value)
-                if new_value in self.index_hash[column.name]:
-                    self.index_hash[column.name][new_value].add(primary_key)
-                else:
-                    self.index_hash[column.name][new_value] = {primary_key}
-
-                if len(self.index_hash[column.name][old_value]) == 1:
-                    self.index_hash[column.name].pop(old_value)
-                else:
-                    self.index_hash[column.name][old_value].remove(primary_key)
+            old_value_keys = column_index[old_value]
+            if len(old_value_keys) == 1:
+                del column_index[old_value]
+            else:
+                old_value_keys.discard(primary_key)
 
         self.primary_hash[primary_key] = new_row
 
@@ -323,20 +568,29 @@ class Table:
         Args:
             row_dict: Key-value pairs representing the row data.
         """
-        primary_key = row_dict[self.primary_column.name]
-        for column_name, column_hash in self.index_hash.items():
-            if column_name != self.primary_column.name:
-                value = row_dict[column_name]
-                if value in column_hash:
-                    self.index_hash[column_name][value].add(primary_key)
-                else:
-                    self.index_hash[column_name][value] = {primary_key}
-        self.primary_hash[row_dict[self.primary_column.name]] = row_dict
+        primary_key = row_dict[self._pk_name]
+        # index_hash never holds the primary column, so every entry is indexed
+        for column_name, column_index in self.index_hash.items():
+            value = row_dict[column_name]
+            primary_keys = column_index.get(value)
+            if primary_keys is None:
+                column_index[value] = {primary_key}
+            else:
+                primary_keys.add(primary_key)
+        self.primary_hash[primary_key] = row_dict
 
     def update_full_hash(self) -> None:
-        """Update the entire hash for all rows in the table."""
-        for row in self.primary_hash.values():
-            self.update_row_hash(row)
+        """Rebuild the index hash of every indexed column from all rows in the table."""
+        rows = self.primary_hash.items()
+        for column_name, column_index in self.index_hash.items():
+            # One scan per indexed column, grouping primary keys by value
+            value_keys = collections.defaultdict(set)
+            for primary_key, row in rows:
+                value_keys[row[column_name]].add(primary_key)
+
+            # Refilled in place, add_row keeps references to these dicts in _index_plan
+            column_index.clear()
+            column_index.update(value_keys)
 
     def save_table_as_json(self, path: str) -> None:
         """Save the table as a JSON file.
@@ -347,11 +601,29 @@ class Table:
         data = {
             'columns': [col.as_dict() for col in self.columns],
             'rows': list(self.primary_hash.values()),
-            'row_order': self.row_order
+            'row_order': list(self.row_order)
         }
 
-        with open(path, 'w') as file:
-            json.dump(data, file)
+        encoded_data = None
+        if orjson is not None:
+            try:
+                # Datetimes are passed through so they are refused like json.dump refuses them
+                encoded_data = orjson.dumps(
+                    data, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+            except orjson.JSONEncodeError:
+                pass  # e.g. ints over 64 bits, left for json to save or to report
+            else:
+                # orjson writes NaN and inf as null and turns values like tuples and enums into plain JSON types;
+                # its output is only used when it reads back as exactly the same data
+                if orjson.loads(encoded_data) != data:
+                    encoded_data = None
+
+        if encoded_data is not None:
+            with open(path, 'wb') as file:
+                file.write(encoded_data)
+        else:
+            with open(path, 'w') as file:
+                json.dump(data, file)
 
     @classmethod
     def load_table_from_json(cls, path: str) -> 'Table':
@@ -363,8 +635,16 @@ class Table:
         Returns:
             Table: The loaded table.
         """
-        with open(path, 'r') as file:
-            data = json.load(file)
+        with open(path, 'rb') as file:
+            # Read as bytes, both parsers take UTF-8 directly
+            raw_data = file.read()
+            if orjson is not None and not _LONG_DIGIT_RUN.search(raw_data):
+                try:
+                    data = orjson.loads(raw_data)
+                except orjson.JSONDecodeError:
+                    data = json.loads(raw_data)  # NaN and Infinity, which json writes but orjson rejects
+            else:
+                data = json.loads(raw_data)
 
             columns_data = data.get('columns', [])
             columns = [TableColumn.from_dict(col_data) for col_data in columns_data]
@@ -412,35 +692,90 @@ class Table:
             key (Optional[Callable[[dict], Any]]): A function to determine the sorting key.
             reverse (bool): Whether to sort in reverse order.
         """
-        self.row_order = sorted(self.row_order, key=lambda k: key(self.primary_hash[k]), reverse=reverse)
+        self.primary_hash = dict(sorted(self.primary_hash.items(), key=lambda item: key(item[1]), reverse=reverse))
 
-    def filter_rows(self, condition: Callable[[dict], bool],
-                    output_format: Literal['TableFormat', 'ListFormat'] = 'TableFormat') -> 'Table' | list[dict[str, Any]]:
+    def filter_rows(self, condition: str | Callable[[dict], bool],
+                    output_format: Literal['TableFormat', 'ListFormat'] = 'TableFormat') -> 'Table | list[dict[str, Any]]':
         """Filter the rows of the table based on a condition.
 
         Args:
-            condition (Callable[[dict], bool]): The filtering condition.
+            condition (str | Callable[[dict], bool]): The filtering condition. Either a function taking the row
+            dictionary, or a Python expression string in which column names are variables, e.g. "age > 18". The
+            string is evaluated as Python code, so it must come from a trusted source.
             output_format (Literal['TableFormat', 'ListFormat']): Whether to return a table with filtered rows or a list of
             filtered row dictionaries.
 
         Returns:
             Table or list[dict]: A new table containing the filtered rows or a list of filtered row dictionaries.
         """
-        filtered_keys = [key for key in self.row_order if condition(self.primary_hash[key])]
-        filtered_rows = [self.primary_hash[key] for key in filtered_keys]
+        rows = self.primary_hash.values()
+        if isinstance(condition, str):
+            # Compiled once, then evaluated against each row with the row dictionary as its local variables
+            code = compile(condition, '<filter>', 'eval')
+            eval_globals = {}
+            filtered_rows = [row for row in rows if eval(code, eval_globals, row)]
+        else:
+            filtered_rows = [row for row in rows if condition(row)]
+
+        return self._format_selected_rows(filtered_rows, output_format)
+
+    def select_in(self, column_name: str, values: Iterable[Any],
+                  output_format: Literal['TableFormat', 'ListFormat'] = 'TableFormat') -> 'Table | list[dict[str, Any]]':
+        """Select the rows whose value in a column is one of the given values.
+
+        Indexed columns (and the primary key column) are answered from their hash, one lookup per value, instead of
+        scanning every row. Other columns fall back to filter_rows.
+
+        Args:
+            column_name (str): The name of the column to match on.
+            values (Iterable[Any]): The values to match.
+            output_format (Literal['TableFormat', 'ListFormat']): Whether to return a table with the selected rows or a
+            list of the selected row dictionaries.
+
+        Returns:
+            Table or list[dict]: A new table containing the selected rows or a list of selected row dictionaries. Rows
+            selected through a hash do not follow row order: they come grouped by value in the order of values, and
+            the order of the rows that share a value is arbitrary (for str keys it can change from run to run). Use
+            filter_rows, or sort_rows on the returned table, when the order matters.
+        """
+        values = dict.fromkeys(values)  # Drops repeated values but keeps their order
+        primary_hash = self.primary_hash
+
+        if column_name == self._pk_name:
+            selected_keys = [value for value in values if value in primary_hash]
+        elif column_name in self.index_hash:
+            column_index = self.index_hash[column_name]
+            selected_keys = [primary_key for value in values for primary_key in column_index.get(value, ())]
+        else:
+            return self.filter_rows(lambda row: row[column_name] in values, output_format)
+
+        return self._format_selected_rows([primary_hash[primary_key] for primary_key in selected_keys], output_format)
 
+    def _format_selected_rows(self, rows: list[dict[str, Any]],
+                              output_format: Literal['TableFormat', 'ListFormat']) -> 'Table | list[dict[str, Any]]':
+        """Return selected rows either as a new table or as the list itself.
+
+        Args:
+            rows (list[dict[str, Any]]): The selected row dictionaries.
+            output_format (Literal['TableFormat', 'ListFormat']): Whether to return a table or the list of rows.
+
+        Returns:
+            Table or list[dict]: A new table containing the rows or the list of row dictionaries.
+        """
         if output_format == 'TableFormat':
             ret_table = Table(columns=[column.clone() for column in self.columns])
-            for row in filtered_rows:
+            for row in rows:
                 ret_table.add_row(**row)
             return ret_table
 
         elif output_format == 'ListFormat':
-            return filtered_rows
+            return rows
 
 
 class RenderTable:
     """Renders a table in various styles."""
+    __slots__ = ('headers', 'style', 'number_of_columns', '_table_rows', '_rows', '_column_widths', '_row_format',
+                 '_sep_simple', '_sep_sql')
 
     def __init__(self, table: Table, style: Literal['simple', 'sql_style']) -> None:
         """Initialize a RenderTable instance.
@@ -451,15 +786,59 @@ class RenderTable:
         """
         self.headers = [column.name for column in table.columns]
 
-        rows = [table.primary_hash[primary_key] for primary_key in table.row_order]
-        self.rows = [list(map(str, [row[col] for col in self.headers])) for row in rows]
-
-        self.column_widths = [max(len(cell) for cell in column) for column in zip(self.headers, *self.rows)]
+        # Only the row references are taken here, cells are stringified on the first render
+        self._table_rows = list(table.primary_hash.values())
+        self._rows = None
 
         self.style = style
 
         self.number_of_columns = table.degree
 
+    @property
+    def rows(self) -> list[list[str]]:
+        """Get the rows of the table with every cell converted to a string.
+
+        Returns:
+            list[list[str]]: The stringified rows.
+        """
+        if self._rows is None:
+            self._prepare()
+        return self._rows
+
+    @property
+    def column_widths(self) -> list[int]:
+        """Get the width of each column, the length of its longest cell or header.
+
+        Returns:
+            list[int]: The column widths.
+        """
+        if self._rows is None:
+            self._prepare()
+        return self._column_widths
+
+    def _prepare(self) -> None:
+        """Stringify the cells and build everything rendering needs, once for all later renders."""
+        # Cells are stringified and the column widths grown in the same pass over the rows
+        headers = self.headers
+        column_widths = list(map(len, headers))
+        rows = []
+        for row in self._table_rows:
+            str_row = [str(row[column_name]) for column_name in headers]
+            column_widths = list(map(max, column_widths, map(len, str_row)))
+            rows.append(str_row)
+        self._rows = rows
+        self._column_widths = column_widths
+
+        # One format call renders a whole row, with each cell padded to its column width
+        col_sep = ['| ', ' | ', ' |']
+        cell_formats = col_sep[1].join(f"{{:<{width}}}" for width in column_widths)
+        self._row_format = (col_sep[0] + cell_formats + col_sep[2]).format
+
+        # The horizontal separator lines only depend on the widths, so both styles are built once here
+        table_width = sum(column_widths) + len(col_sep[1]) * self.number_of_columns
+        self._sep_simple = ' ' + (table_width - 1) * '=' + ' '
+        self._sep_sql = '+-' + (table_width - 3) * '-' + '-+'
+
     def get_render(self) -> str:
         """Get the rendered representation of the table based on the selected style.
 
@@ -478,48 +857,37 @@ class RenderTable:
         Returns:
             str: The rendered table.
         """
-        col_sep = ['| ', ' | ', ' |']
-        row_sep = [' ', '=', ' ']
-        rows = []
-        seperator = row_sep[0] + (sum(self.column_widths) +
-                                  len(col_sep[1]) * self.number_of_columns - 1) * row_sep[1] + row_sep[2]
-        if self.headers:
-            header_row = [f"{self.headers[i]:<{self.column_widths[i]}}" for i in range(self.number_of_columns)]
-            header = col_sep[0] + col_sep[1].join(header_row) + col_sep[2]
-            rows += [seperator, header, seperator]
-        else:
-            rows += [seperator]
+        if self._rows is None:
+            self._prepare()
+        return self._render(self._sep_simple)
 
-        for row in self.rows:
-            row_data = [f"{row[i]:<{self.column_widths[i]}}" for i in range(self.number_of_columns)]
-            rows.append(col_sep[0] + col_sep[1].join(row_data) + col_sep[2])
+    def render_sql_style(self) -> str:
+        """Render the table in SQL style.
 
-        rows += [seperator]
+        Returns:
+            str: The rendered table.
+        """
+        if self._rows is None:
+            self._prepare()
+        return self._render(self._sep_sql)
 
-        return "\n".join(rows)
+    def _render(self, seperator: str) -> str:
+        """Render the table with the given horizontal separator line.
 
-    def render_sql_style(self) -> str:
-        """Render the table in SQL style.
+        Args:
+            seperator (str): The line drawn above and below the header and below the last row.
 
         Returns:
             str: The rendered table.
         """
-        col_sep = ['| ', ' | ', ' |']
-        row_sep = ['+-', '-', '-+']
-        rows = []
-        seperator = row_sep[0] + (sum(self.column_widths) +
-                                  len(col_sep[1]) * self.number_of_columns - 3) * row_sep[1] + row_sep[2]
+        row_format = self._row_format
+        rows = [seperator]
+        append = rows.append
         if self.headers:
-            header_row = [f"{self.headers[i]:<{self.column_widths[i]}}" for i in range(self.number_of_columns)]
-            header = col_sep[0] + col_sep[1].join(header_row) + col_sep[2]
-            rows += [seperator, header, seperator]
-        else:
-            rows += [seperator]
-
-        for row in self.rows:
-            row_data = [f"{row[i]:<{self.column_widths[i]}}" for i in range(self.number_of_columns)]
-            rows.append(col_sep[0] + col_sep[1].join(row_data) + col_sep[2])
+            append(row_format(*self.headers))
+            append(seperator)
 
-        rows += [seperator]
+        rows.extend(starmap(row_format, self._rows))
+        append(seperator)
 
         return "\n".join(rows)
@@ -1,7 +1,14 @@
 import math
 
+try:
+    import numpy as np  # Only needed by VectorArray
+except ImportError:
+    np = None
+
 
 class Vector:
+    __slots__ = ('x', 'y', 'z')
+
     def __init__(self, *comp):
         if len(comp) == 1 and isinstance(comp[0], (list, tuple)):
             comp = comp[0]
@@ -20,6 +27,13 @@ class Vector:
         else:
             raise ValueError('Vector can have only 0, 1, 2 or 3 components')
 
+    @classmethod
+    def _wrap(cls, x, y, z):
+        # Builds a vector from already validated components, skipping the checks in __init__
+        vector = object.__new__(cls)
+        vector.x, vector.y, vector.z = x, y, z
+        return vector
+
     def __len__(self):
         return 3
 
@@ -58,7 +72,7 @@ class Vector:
         if not isinstance(other, Vector):
             raise TypeError('Cannot add non-vector to vector')
         else:
-            return Vector(self.x + other.x, self.y + other.y, self.z + other.z)
+            return Vector._wrap(self.x + other.x, self.y + other.y, self.z + other.z)
 
     def __radd__(self, other):
         if not isinstance(other, Vector):
@@ -69,23 +83,23 @@ class Vector:
         if not isinstance(other, Vector):
             raise TypeError('Cannot subtract non-vector from vector')
         else:
-            return Vector(self.x - other.x, self.y - other.y, self.z - other.z)
+            return Vector._wrap(self.x - other.x, self.y - other.y, self.z - other.z)
 
     def __rsub__(self, other):
         if not isinstance(other, Vector):
             raise TypeError('Cannot subtract vector from non-vector')
         else:
-            return Vector(other.x - self.x, other.y - self.y, other.z - self.z)
+            return Vector._wrap(other.x - self.x, other.y - self.y, other.z - self.z)
 
     def __neg__(self):
-        return Vector(-self.x, -self.y, -self.z)
+        return Vector._wrap(-self.x, -self.y, -self.z)
 
     def __abs__(self):
-        return math.hypot(math.hypot(self.x, self.y), self.z)
+        return math.hypot(self.x, self.y, self.z)
 
     def __mul__(self, other):
         if isinstance(other, (int, float)):
-            return Vector(self.x * other, self.y * other, self.z * other)
+            return Vector._wrap(self.x * other, self.y * other, self.z * other)
         elif isinstance(other, Vector):
             return self.x * other.x + self.y * other.y + self.z * other.z
         else:
@@ -96,16 +110,16 @@ class Vector:
 
     def __matmul__(self, other):
         if isinstance(other, Vector):
-            return Vector(self.y * other.z - self.z * other.y,
-                          self.z * other.x - self.x * other.z,
-                          self.x * other.y - self.y * other.x)
+            return Vector._wrap(self.y * other.z - self.z * other.y,
+                                self.z * other.x - self.x * other.z,
+                                self.x * other.y - self.y * other.x)
         else:
             raise TypeError('Cross product can be done only between two vectors')
 
     def __truediv__(self, other):
         if isinstance(other, (int, float)):
             if other != 0:
-                return Vector(self.x / other, self.y / other, self.z / other)
+                return Vector._wrap(self.x / other, self.y / other, self.z / other)
             else:
                 raise ZeroDivisionError('Division by zero is not allowed when dividing a vector by a scalar')
         else:
@@ -119,25 +133,28 @@ class Vector:
 
     def cross(self, vector):
         if isinstance(vector, Vector):
-            return Vector(self.y * vector.z - self.z * vector.y,
-                          self.z * vector.x - self.x * vector.z,
-                          self.x * vector.y - self.y * vector.x)
+            return Vector._wrap(self.y * vector.z - self.z * vector.y,
+                                self.z * vector.x - self.x * vector.z,
+                                self.x * vector.y - self.y * vector.x)
         else:
             raise TypeError('Cross product can be done only between two vectors')
 
     def magnitude(self):
-        return math.sqrt((self.x * self.x) + (self.y * self.y) + (self.x * self.y))
+        return math.hypot(self.x, self.y, self.z)
 
     def normalize(self):
-        mag = math.sqrt((self.x * self.x) + (self.y * self.y) + (self.x * self.y))
-        return Vector(self.x / mag, self.y / mag, self.z / mag)
+        mag = self.magnitude()
+        return Vector._wrap(self.x / mag, self.y / mag, self.z / mag)
 
     def angle(self, vector, in_degrees=False):
         if isinstance(vector, Vector):
-            if self.magnitude() == 0 or vector.magnitude() == 0:
+            self_mag = self.magnitude()
+            vector_mag = vector.magnitude()
+            if self_mag == 0 or vector_mag == 0:
                 raise ZeroDivisionError('Angle cant be measured between a null vector and other vector')
             else:
-                angle = math.acos((self.dot(vector)) / (self.magnitude() * vector.magnitude()))
+                dot = self.x * vector.x + self.y * vector.y + self.z * vector.z
+                angle = math.acos(dot / (self_mag * vector_mag))
                 if in_degrees:
                     return math.degrees(angle)
                 else:
@@ -147,13 +164,148 @@ class Vector:
 
     def project_on(self, projection_dir):
         if isinstance(projection_dir, Vector):
-            if projection_dir.magnitude() == 0:
+            dir_x, dir_y, dir_z = projection_dir.x, projection_dir.y, projection_dir.z
+            dir_sq = dir_x * dir_x + dir_y * dir_y + dir_z * dir_z  # Squared magnitude, so no sqrt is needed
+            if dir_sq == 0:
                 raise ZeroDivisionError('Projection direction cant be a null vector')
             else:
-                return (self.dot(projection_dir) / projection_dir.dot(projection_dir)) * projection_dir
+                scale = (self.x * dir_x + self.y * dir_y + self.z * dir_z) / dir_sq
+                return Vector._wrap(dir_x * scale, dir_y * scale, dir_z * scale)
         else:
             raise TypeError('Projection direction must be a vector')
 
 
 UNIT_VECTOR = Vector(1)
 NULL_VECTOR = Vector()
+
+
+class VectorArray:
+    # N vectors held in one (N, 3) float64 array, so each operation is a single numpy call instead of N Vector calls
+    __slots__ = ('_a',)
+
+    def __init__(self, vectors=()):
+        if np is None:
+            raise ImportError('VectorArray requires numpy to be installed')
+
+        if isinstance(vectors, VectorArray):
+            vectors = vectors._a
+        elif not isinstance(vectors, np.ndarray):
+            vectors = [(v.x, v.y, v.z) if isinstance(v, Vector) else v for v in vectors]
+
+        array = np.array(vectors, dtype=np.float64)
+        if array.size == 0:
+            array = array.reshape(0, 3)
+        if array.ndim != 2 or array.shape[1] != 3:
+            raise ValueError('VectorArray needs N vectors of 3 components each')
+        self._a = array
+
+    @classmethod
+    def _wrap(cls, array):
+        # Wraps an (N, 3) array produced by an operation on valid arrays, skipping the checks in __init__
+        vector_array = object.__new__(cls)
+        vector_array._a = array
+        return vector_array
+
+    @staticmethod
+    def _components(other):
+        if isinstance(other, VectorArray):
+            return other._a
+        elif isinstance(other, Vector):
+            return np.array((other.x, other.y, other.z), dtype=np.float64)  # Broadcast against every row
+        else:
+            return None
+
+    @property
+    def x(self):
+        return self._a[:, 0]
+
+    @property
+    def y(self):
+        return self._a[:, 1]
+
+    @property
+    def z(self):
+        return self._a[:, 2]
+
+    def __len__(self):
+        return len(self._a)
+
+    def __repr__(self):
+        return f'VectorArray({self._a.tolist()})'
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return VectorArray._wrap(self._a[index])
+        # A single row comes back as a Vector copy; write it back with __setitem__ to change the array
+        return Vector._wrap(*self._a[index].tolist())
+
+    def __setitem__(self, index, value):
+        if isinstance(value, Vector):
+            value = (value.x, value.y, value.z)
+        self._a[index] = value
+
+    def __iter__(self):
+        for x, y, z in self._a.tolist():
+            yield Vector._wrap(x, y, z)
+
+    def __add__(self, other):
+        other_array = VectorArray._components(other)
+        if other_array is None:
+            raise TypeError('Can only add a vector or vector array to a vector array')
+        return VectorArray._wrap(self._a + other_array)
+
+    def __sub__(self, other):
+        other_array = VectorArray._components(other)
+        if other_array is None:
+            raise TypeError('Can only subtract a vector or vector array from a vector array')
+        return VectorArray._wrap(self._a - other_array)
+
+    def __neg__(self):
+        return VectorArray._wrap(-self._a)
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return VectorArray._wrap(self._a * other)
+        elif isinstance(other, (Vector, VectorArray)):
+            return self.dot(other)
+        else:
+            raise TypeError('Multiplication is only allowed with a vector, a vector array or an int/float')
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __matmul__(self, other):
+        return self.cross(other)
+
+    def __truediv__(self, other):
+        if isinstance(other, (int, float)):
+            if other != 0:
+                return VectorArray._wrap(self._a / other)
+            else:
+                raise ZeroDivisionError('Division by zero is not allowed when dividing a vector array by a scalar')
+        else:
+            raise TypeError('Vector array division can only be done by a scalar (int or float)')
+
+    def dot(self, other):
+        # One dot product per row
+        other_array = VectorArray._components(other)
+        if other_array is None:
+            raise TypeError('Dot product can be done only with a vector or vector array')
+        if other_array.ndim == 1:
+            return self._a @ other_array
+        return np.einsum('ij,ij->i', self._a, other_array)
+
+    def cross(self, other):
+        other_array = VectorArray._components(other)
+        if other_array is None:
+            raise TypeError('Cross product can be done only with a vector or vector array')
+        return VectorArray._wrap(np.cross(self._a, other_array))
+
+    def magnitude(self):
+        return np.linalg.norm(self._a, axis=1)
+
+    def normalize(self):
+        mags = self.magnitude()
+        if not mags.all():
+            raise ZeroDivisionError('Cannot normalize a vector array that contains a null vector')
+        return VectorArray._wrap(self._a / mags[:, np.newaxis])